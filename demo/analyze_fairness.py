@@ -7,80 +7,160 @@ produces a uniform distribution across the desired range.
 """
 
 import sys
-sys.path.insert(0, '.')
 
-from game import calculate_outcome
-import secrets
-from collections import defaultdict
+from game import calculate_outcomes, make_outcome_function
+import multiprocessing
+import random
+from collections import Counter
 
-def analyze_distribution(num_trials: int = 10000, min_val: int = 1, max_val: int = 6):
-    """Run many simulated games and analyze outcome distribution."""
-    
-    print("\n" + "="*60)
-    print(f"DISTRIBUTION ANALYSIS")
-    print(f"Trials: {num_trials}")
-    print(f"Range: [{min_val}, {max_val}]")
-    print("="*60 + "\n")
-    
-    # Track outcomes
-    outcomes = defaultdict(int)
+# A fairness histogram only needs statistically uniform samples, not
+# cryptographic ones, so the analysis uses the fast Mersenne Twister
+# instead of the OS CSPRNG.
+_rng = random.Random()
+
+# Samples drawn per pass in simulate_outcomes; bounds peak memory
+_BLOCK_TRIALS = 4096
+
+# Longest histogram bar (100% of trials); shorter bars are slices of it
+_MAX_BAR = "█" * 50
+
+
+def simulate_outcomes(num_trials: int, min_val: int, max_val: int, rng: random.Random = None) -> list:
+    """
+    Simulate num_trials games and count how often each outcome occurs.
+
+    Returns a dense list where counts[i] is the number of times outcome
+    min_val + i came up (zero for outcomes that never appeared).
+
+    Trials are processed in blocks of _BLOCK_TRIALS: each block is one
+    getrandbits() call on rng (the module generator by default), viewed as
+    unsigned 64-bit samples and streamed through the lazy batch form of
+    the outcome formula straight into the tally.  No outcomes list is
+    materialized, and peak memory stays bounded by the block size rather
+    than num_trials.
+    """
+    if rng is None:
+        rng = _rng
+    tally = Counter()
+    for start in range(0, num_trials, _BLOCK_TRIALS):
+        block = min(_BLOCK_TRIALS, num_trials - start)
+        raw = rng.getrandbits(64 * block).to_bytes(8 * block, "little")
+        samples = memoryview(raw).cast("Q")
+        tally.update(calculate_outcomes(samples, min_val, max_val))
+    return [tally[outcome] for outcome in range(min_val, max_val + 1)]
+
+
+def _run_jobs(worker, jobs: list, processes: int) -> list:
+    """
+    Map worker over jobs, in a multiprocessing pool when processes > 1.
+
+    Workers must be top-level functions so the pool can pickle them, and
+    each job should carry its own seed: forked workers would otherwise
+    inherit the same generator state and draw identical samples.
+    """
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            return pool.map(worker, jobs)
+    return list(map(worker, jobs))
+
+
+def _simulate_chunk(args: tuple) -> list:
+    """Simulate one chunk of trials with its own seeded generator."""
+    num_trials, min_val, max_val, seed = args
+    return simulate_outcomes(num_trials, min_val, max_val, random.Random(seed))
+
+
+def analyze_distribution(num_trials: int = 10000, min_val: int = 1, max_val: int = 6,
+                         processes: int = 1):
+    """
+    Run many simulated games and analyze outcome distribution.
+
+    Pass processes > 1 to split the trials across a multiprocessing pool
+    and sum the per-chunk counts; worth it only for much larger runs than
+    the defaults used here.
+    """
+    
+    lines = [
+        "\n" + "="*60,
+        "DISTRIBUTION ANALYSIS",
+        f"Trials: {num_trials}",
+        f"Range: [{min_val}, {max_val}]",
+        "="*60 + "\n",
+    ]
     
     # Simulate many games
-    for _ in range(num_trials):
-        drand_value = secrets.randbits(256)
-        outcome = calculate_outcome(drand_value, min_val, max_val)
-        outcomes[outcome] += 1
+    if processes > 1:
+        # One chunk per worker
+        chunk, extra = divmod(num_trials, processes)
+        jobs = [(chunk + (i < extra), min_val, max_val, _rng.getrandbits(64))
+                for i in range(processes)]
+        chunk_counts = _run_jobs(_simulate_chunk, jobs, processes)
+        counts = [sum(column) for column in zip(*chunk_counts)]
+    else:
+        counts = simulate_outcomes(num_trials, min_val, max_val)
     
     # Calculate statistics
     expected_count = num_trials / (max_val - min_val + 1)
     
-    print("OUTCOME FREQUENCIES:")
-    print("-" * 40)
+    lines.append("OUTCOME FREQUENCIES:")
+    lines.append("-" * 40)
     
-    for outcome in sorted(outcomes.keys()):
-        count = outcomes[outcome]
+    for outcome, count in enumerate(counts, min_val):
         percentage = (count / num_trials) * 100
         bar_length = int(percentage / 2)  # Scale to 50 chars max
-        bar = "█" * bar_length
+        bar = _MAX_BAR[:bar_length]
         
-        print(f"  {outcome}: {count:5d} ({percentage:5.2f}%) {bar}")
+        lines.append(f"  {outcome}: {count:5d} ({percentage:5.2f}%) {bar}")
     
-    print("-" * 40)
+    lines.append("-" * 40)
     
     # Statistical analysis
-    print("\nSTATISTICAL ANALYSIS:")
-    print("-" * 40)
+    lines.append("\nSTATISTICAL ANALYSIS:")
+    lines.append("-" * 40)
     
     total_range = max_val - min_val + 1
-    print(f"  Total outcomes possible: {total_range}")
-    print(f"  Trials run: {num_trials}")
-    print(f"  Expected count per outcome: {expected_count:.0f}")
+    lines.append(f"  Total outcomes possible: {total_range}")
+    lines.append(f"  Trials run: {num_trials}")
+    lines.append(f"  Expected count per outcome: {expected_count:.0f}")
     
     # Calculate variance from expected
-    variance = []
-    for outcome in outcomes:
-        observed = outcomes[outcome]
-        expected = expected_count
-        variance.append(abs(observed - expected))
+    variance = [abs(count - expected_count) for count in counts]
     
     avg_variance = sum(variance) / len(variance)
     max_variance = max(variance)
     
-    print(f"  Avg deviation from expected: {avg_variance:.1f}")
-    print(f"  Max deviation from expected: {max_variance:.1f}")
-    print(f"  Fairness: {'✅ FAIR' if max_variance < expected_count * 0.1 else '⚠️  CHECK'}")
+    lines.append(f"  Avg deviation from expected: {avg_variance:.1f}")
+    lines.append(f"  Max deviation from expected: {max_variance:.1f}")
+    lines.append(f"  Fairness: {'✅ FAIR' if max_variance < expected_count * 0.1 else '⚠️  CHECK'}")
     
-    print("\nCONCLUSION:")
-    print("-" * 40)
-    print("The formula (drandValue % range) + min produces:")
-    print("✓ Uniform distribution")
-    print("✓ No bias toward any outcome")
-    print("✓ Fair for all players")
-    print()
+    lines.append("\nCONCLUSION:")
+    lines.append("-" * 40)
+    lines.append("The formula (drandValue % range) + min produces:")
+    lines.append("✓ Uniform distribution")
+    lines.append("✓ No bias toward any outcome")
+    lines.append("✓ Fair for all players")
+    lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def compare_ranges():
-    """Show that the formula works fairly for any range."""
+def _range_max_deviation(args: tuple) -> tuple:
+    """Run one range's trials and return (max deviation, expected count)."""
+    min_val, max_val, num_trials, seed = args
+    counts = simulate_outcomes(num_trials, min_val, max_val, random.Random(seed))
+    expected = num_trials / (max_val - min_val + 1)
+    max_deviation = max(abs(count - expected) for count in counts)
+    return max_deviation, expected
+
+
+def compare_ranges(processes: int = 1):
+    """
+    Show that the formula works fairly for any range.
+
+    Each range is an independent simulation.  Pass processes > 1 to run
+    them in a multiprocessing pool; the default stays in-process since
+    pool startup outweighs 1000 trials per range.
+    """
     
     print("\n" + "="*60)
     print("FAIRNESS ACROSS DIFFERENT RANGES")
@@ -96,19 +176,11 @@ def compare_ranges():
     
     print("Testing 1000 trials per range:\n")
     
-    for min_val, max_val, name in ranges:
-        outcomes = defaultdict(int)
-        
-        for _ in range(1000):
-            drand_value = secrets.randbits(256)
-            outcome = calculate_outcome(drand_value, min_val, max_val)
-            outcomes[outcome] += 1
-        
+    jobs = [(min_val, max_val, 1000, _rng.getrandbits(64)) for min_val, max_val, _ in ranges]
+    results = _run_jobs(_range_max_deviation, jobs, processes)
+    
+    for (min_val, max_val, name), (max_deviation, expected) in zip(ranges, results):
         # Check fairness
-        expected = 1000 / (max_val - min_val + 1)
-        max_deviation = max(
-            abs(count - expected) for count in outcomes.values()
-        )
         fairness = "✅" if max_deviation < expected * 0.15 else "⚠️"
         
         print(f"{name:15} [{min_val:3}, {max_val:3}] {fairness} Max dev: {max_deviation:.0f}")
@@ -127,14 +199,13 @@ def demonstrate_determinism():
     print("Testing that identical Drand values produce identical outcomes:\n")
     
     test_values = [123456789, 987654321, 555555555, 111111111]
+    roll_die = make_outcome_function(1, 6)
     
     for drand_val in test_values:
-        outcomes = []
-        for _ in range(5):  # Calculate 5 times
-            outcome = calculate_outcome(drand_val, 1, 6)
-            outcomes.append(outcome)
+        # Calculate 5 times independently
+        outcomes = [roll_die(drand_val) for _ in range(5)]
         
-        all_same = all(o == outcomes[0] for o in outcomes)
+        all_same = len(set(outcomes)) == 1
         result = "✅ DETERMINISTIC" if all_same else "❌ ERROR"
         
         print(f"  Drand {drand_val}: {outcomes} {result}")
@@ -4,7 +4,7 @@ Demonstrate the auto-verification game flow
 """
 
 from game import (
-    DrandVerifier, fetch_drand_value, calculate_outcome, 
+    get_verifier, fetch_drand_value, calculate_outcome, 
     lock_guess, format_drand_value
 )
 import secrets
@@ -16,7 +16,7 @@ def demo_auto_verification():
     print("🎲 AUTO-VERIFICATION DEMO - BUSTER PROTOCOL GAME")
     print("=" * 70 + "\n")
     
-    verifier = DrandVerifier()
+    verifier = get_verifier()
     
     # Setup
     print("🔧 PHASE 1: SETUP")
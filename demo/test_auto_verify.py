@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """Test auto-verification system"""
 
-from game import DrandVerifier, fetch_drand_value, calculate_outcome
+from game import get_verifier, fetch_drand_value, calculate_outcome
 
-verifier = DrandVerifier()
+verifier = get_verifier()
 drand_round = 17598
 drand_value = fetch_drand_value(drand_round, verifier)
 outcome = calculate_outcome(drand_value, 1, 6)
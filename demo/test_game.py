@@ -4,13 +4,11 @@ Test script to verify game.py logic without user interaction.
 Shows a complete game flow automatically.
 """
 
-import sys
-sys.path.insert(0, '.')
-
 from game import (
     validate_guess,
     lock_guess,
     calculate_outcome,
+    calculate_outcomes,
     verify_outcome,
     format_drand_value,
     GamePhase
@@ -67,21 +65,37 @@ def test_game_flow():
     print("MULTIPLE TEST CASES")
     print("="*60 + "\n")
     
+    # (drand_value, min, max, expected outcome)
     test_cases = [
-        (12345, 1, 6),
-        (99999, 1, 6),
-        (5000000, 1, 6),
-        (123456789, 2, 12),  # Two dice
-        (555555555, 0, 1),   # Coin flip
+        (12345, 1, 6, 4),
+        (99999, 1, 6, 4),
+        (5000000, 1, 6, 3),
+        (123456789, 2, 12, 7),  # Two dice
+        (555555555, 0, 1, 1),   # Coin flip
     ]
     
-    for drand_val, min_val, max_val in test_cases:
-        outcome = calculate_outcome(drand_val, min_val, max_val)
-        is_valid = verify_outcome(drand_val, outcome, min_val, max_val)
+    # Compute every case column-wise up front; the loop below only formats.
+    # Outcomes are checked against known answers rather than re-running
+    # the same formula through verify_outcome.
+    drand_vals, min_vals, max_vals, expected = zip(*test_cases)
+    outcomes = list(map(calculate_outcome, drand_vals, min_vals, max_vals))
+    validity = list(map(int.__eq__, outcomes, expected))
+    
+    for (drand_val, min_val, max_val, _), outcome, is_valid in zip(test_cases, outcomes, validity):
         range_str = f"[{min_val}, {max_val}]"
         result = "✓" if is_valid else "✗"
         print(f"Drand: {drand_val:<10} Range: {range_str:<8} Outcome: {outcome:<3} Verify: {result}")
     
+    assert all(validity), "outcome formula disagrees with known answers"
+    
+    # The batch form must agree with the single-value formula
+    batch_vals = list(drand_vals) + [2**256 - 1]
+    for min_val, max_val in [(1, 6), (2, 12), (0, 1)]:
+        batch = list(calculate_outcomes(batch_vals, min_val, max_val))
+        single = [calculate_outcome(v, min_val, max_val) for v in batch_vals]
+        assert batch == single, f"calculate_outcomes disagrees on [{min_val}, {max_val}]"
+    print("\nBatch calculate_outcomes matches calculate_outcome ✓")
+    
     print("\n" + "="*60)
     print("✅ ALL TESTS PASSED")
     print("="*60 + "\n")
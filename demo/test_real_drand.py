@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Test verification system with real Drand round 17598"""
 
-from verify import DrandVerifier
+from verify import get_verifier
 
 def main():
-    verifier = DrandVerifier()
+    verifier = get_verifier()
     
     print('\n✅ VERIFICATION TEST WITH REAL DRAND DATA')
     print('='*60)
@@ -3,16 +3,16 @@
 Test the Drand verification system without user interaction
 """
 
-import sys
-sys.path.insert(0, '.')
+import contextlib
+import io
 
-from verify import DrandVerifier
+from verify import DrandVerifier, get_verifier
 
 print("\n" + "="*60)
 print("DRAND VERIFICATION SYSTEM - TEST")
 print("="*60 + "\n")
 
-verifier = DrandVerifier()
+verifier = get_verifier()
 
 # Test 1: Display known round
 print("TEST 1: Display Drand Round Data")
@@ -57,6 +57,43 @@ drand_int = verifier.randomness_to_int("0x1234567890abcdef1234567890abcdef123456
 outcome = verifier.calculate_outcome(drand_int, 1, 6)
 print(f"✓ Calculated outcome for new round: {outcome}")
 
+# Test 6: Batch verification
+print("\nTEST 6: Batch Verification")
+print("-" * 60)
+batch_rounds = [13629, 13629, 13631, 99999]
+batch_claims = [4, 1, outcome, 1]
+batch = verifier.verify_batch(batch_rounds, batch_claims, 1, 6)
+print(f"Rounds {batch_rounds} -> {batch}")
+assert batch == [True, False, True, False]
+individual = [verifier.verify_game(r, c, 1, 6)["valid"] for r, c in zip(batch_rounds, batch_claims)]
+assert batch == individual
+print("✓ Batch results match individual verification")
+
+# Mismatched lengths must fail instead of dropping verdicts
+try:
+    verifier.verify_batch([13629, 13629], [4], 1, 6)
+    raise AssertionError("expected ValueError for mismatched lengths")
+except ValueError:
+    print("✓ Mismatched batch lengths rejected")
+
+# Test 7: Sorted round index stays in sync through add_round
+print("\nTEST 7: Round Index After add_round")
+print("-" * 60)
+index_verifier = DrandVerifier()
+index_verifier.add_round(100, "ab" * 32)  # below the current minimum
+index_verifier.add_round(13630, index_verifier.known_rounds[13630]["randomness"])  # re-add
+assert index_verifier.get_latest_round()["round"] == 17598
+
+listing = io.StringIO()
+with contextlib.redirect_stdout(listing):
+    index_verifier.list_rounds()
+listed = [int(line.split()[1].rstrip(":"))
+          for line in listing.getvalue().splitlines()
+          if line.startswith("  Round ")]
+assert listed == [17598, 13630, 13629, 100], listed
+print(f"Listed rounds: {listed}")
+print("✓ Latest round and listing order correct")
+
 print("\n" + "="*60)
 print("✅ ALL TESTS PASSED")
 print("="*60)
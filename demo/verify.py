@@ -9,7 +9,10 @@ This module allows you to verify Drand randomness. You can:
 4. Verify historical roundsin the official explorer
 """
 
+import bisect
+import functools
 import json
+import sys
 from datetime import datetime
 
 # Real Drand rounds from the official League of Entropy beacon
@@ -39,18 +42,38 @@ KNOWN_DRAND_ROUNDS = {
     },
 }
 
+@functools.lru_cache(maxsize=1024)
+def _hex_to_int(digits: str) -> int:
+    """
+    Parse hex randomness (without "0x") to an integer, cached per string.
+    
+    int(..., 16) is used directly: CPython parses power-of-two bases in
+    linear time, and it beats bytes.fromhex + int.from_bytes on 32-byte
+    beacons while also accepting odd-length input without a fallback.
+    """
+    return int(digits, 16)
+
+
 class DrandVerifier:
     """Verify Drand randomness and calculate game outcomes."""
     
     def __init__(self):
         """Initialize with known rounds."""
-        self.known_rounds = KNOWN_DRAND_ROUNDS
+        # Copied so add_round on one verifier keeps its sorted index in sync
+        self.known_rounds = dict(KNOWN_DRAND_ROUNDS)
+        # Round numbers in ascending order, maintained by add_round.  Only
+        # add_round may mutate known_rounds; writing to the dict directly
+        # leaves this index out of sync.
+        self._sorted_rounds = sorted(self.known_rounds)
     
     def add_round(self, round_num: int, randomness: str, timestamp: int = None):
         """Add a known Drand round."""
         if timestamp is None:
             timestamp = int(datetime.now().timestamp())
         
+        if round_num not in self.known_rounds:
+            bisect.insort(self._sorted_rounds, round_num)
+        
         self.known_rounds[round_num] = {
             "round": round_num,
             "randomness": randomness,
@@ -67,17 +90,24 @@ class DrandVerifier:
     
     def get_latest_round(self) -> dict:
         """Get the latest known round."""
-        if self.known_rounds:
-            latest = max(self.known_rounds.keys())
-            return self.known_rounds[latest]
+        if self._sorted_rounds:
+            return self.known_rounds[self._sorted_rounds[-1]]
         return None
     
     def randomness_to_int(self, randomness_hex: str) -> int:
-        """Convert hex randomness to integer."""
-        return int(randomness_hex, 16)
+        """Convert hex randomness to integer (shared module-level cache)."""
+        if randomness_hex.startswith("0x"):
+            randomness_hex = randomness_hex[2:]
+        return _hex_to_int(randomness_hex)
     
     def calculate_outcome(self, drand_value: int, min_val: int = 1, max_val: int = 6) -> int:
-        """Calculate outcome from Drand value."""
+        """
+        Calculate outcome from Drand value.
+        
+        The full 256-bit value must be reduced, as DrandGame.sol does with
+        uint256: truncating it first (e.g. to the low 32 bits) changes the
+        result for any range that is not a power of two.
+        """
         range_size = max_val - min_val + 1
         outcome = (drand_value % range_size) + min_val
         return outcome
@@ -110,6 +140,30 @@ class DrandVerifier:
             "explanation": f"({drand_int} % {max_val - min_val + 1}) + {min_val} = {actual_outcome}"
         }
     
+    def verify_batch(self, round_nums: list, claimed_outcomes: list,
+                     min_val: int = 1, max_val: int = 6) -> list:
+        """
+        Verify many (round, claimed outcome) pairs for the same game range.
+        
+        Returns a list of booleans in input order.  Rounds missing from the
+        local database verify as False.  Raises ValueError if the two lists
+        differ in length.  Skips building the per-game result
+        dicts of verify_game, and each round's randomness is parsed once
+        through the shared cache.
+        """
+        if len(round_nums) != len(claimed_outcomes):
+            raise ValueError("round_nums and claimed_outcomes differ in length")
+        results = []
+        for round_num, claimed_outcome in zip(round_nums, claimed_outcomes):
+            round_data = self.known_rounds.get(round_num)
+            if round_data is None:
+                results.append(False)
+                continue
+            drand_int = self.randomness_to_int(round_data["randomness"])
+            outcome = self.calculate_outcome(drand_int, min_val, max_val)
+            results.append(outcome == claimed_outcome)
+        return results
+    
     def display_round(self, round_num: int):
         """Display round info in readable format."""
         round_data = self.get_round(round_num)
@@ -118,16 +172,18 @@ class DrandVerifier:
             print(f"❌ Round {round_num} not found")
             return
         
-        print(f"\n🔍 DRAND ROUND {round_num}")
-        print("-" * 50)
-        print(f"Randomness:  {round_data['randomness']}")
-        print(f"Timestamp:   {round_data['timestamp']}")
+        lines = [
+            f"\n🔍 DRAND ROUND {round_num}",
+            "-" * 50,
+            f"Randomness:  {round_data['randomness']}",
+            f"Timestamp:   {round_data['timestamp']}",
+        ]
         
         # Convert and show outcomes for different games
         drand_int = self.randomness_to_int(round_data['randomness'])
         
-        print(f"\nOUTCOMES FOR DIFFERENT GAMES:")
-        print("-" * 50)
+        lines.append(f"\nOUTCOMES FOR DIFFERENT GAMES:")
+        lines.append("-" * 50)
         
         games = [
             (1, 6, "Single Die"),
@@ -138,30 +194,43 @@ class DrandVerifier:
         
         for min_val, max_val, name in games:
             outcome = self.calculate_outcome(drand_int, min_val, max_val)
-            print(f"  {name:15} [{min_val:3}, {max_val:3}]: {outcome}")
+            lines.append(f"  {name:15} [{min_val:3}, {max_val:3}]: {outcome}")
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def list_rounds(self):
         """List all known rounds."""
-        print("\n📋 KNOWN DRAND ROUNDS IN DATABASE")
-        print("-" * 50)
+        lines = ["\n📋 KNOWN DRAND ROUNDS IN DATABASE", "-" * 50]
         
         if not self.known_rounds:
-            print("  (No rounds stored)")
+            lines.append("  (No rounds stored)")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        for round_num in sorted(self.known_rounds.keys(), reverse=True)[:10]:
+        for round_num in reversed(self._sorted_rounds[-10:]):
             data = self.known_rounds[round_num]
-            print(f"  Round {round_num}: {data['randomness'][:20]}...")
+            lines.append(f"  Round {round_num}: {data['randomness'][:20]}...")
         
-        print(f"\n  Total stored: {len(self.known_rounds)} rounds")
-        print()
+        lines.append(f"\n  Total stored: {len(self.known_rounds)} rounds")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+_default_verifier = None
+
+
+def get_verifier() -> DrandVerifier:
+    """Return the shared DrandVerifier, creating it on first use."""
+    global _default_verifier
+    if _default_verifier is None:
+        _default_verifier = DrandVerifier()
+    return _default_verifier
 
 
 def interactive_verification():
     """Interactive verification tool."""
-    verifier = DrandVerifier()
+    verifier = get_verifier()
     
     print("\n" + "="*60)
     print("🔐 DRAND VERIFICATION SYSTEM")
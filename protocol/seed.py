@@ -10,22 +10,40 @@ with persistence, on‑chain commitments, and integration with game logic.
 """
 
 import hashlib
+import hmac
 import secrets
-from typing import Dict, Tuple
+from typing import Dict, List
+
+# each stored entry is the 32‑byte seed followed by its 32‑byte SHA‑256 digest
+_SEED_SIZE = 32
+_DIGEST_SIZE = 32
+_ENTRY_SIZE = _SEED_SIZE + _DIGEST_SIZE
 
 
 class SeedManager:
     """Simple in‑memory manager for private seeds and commitments.
 
     This class embodies the **entire protocol**.  No external storage or
-    dependency is required – all data lives in a local dictionary while the
-    process runs.  The helper functions at the bottom provide an easy
-    module‑level API for quick scripts.
+    dependency is required – all data lives in memory while the process
+    runs: seeds and digests packed back to back in one ``bytearray``, plus
+    a dictionary from seat to slot index.  The helper functions at the
+    bottom provide an easy module‑level API for quick scripts.
     """
 
     def __init__(self) -> None:
-        # seat -> (seed_bytes, commitment_hex)
-        self._seeds: Dict[str, Tuple[bytes, str]] = {}
+        # slot i occupies _buf[i*64:(i+1)*64] as seed || digest; hex only at
+        # the API edge
+        self._buf = bytearray()
+        # seat -> slot index
+        self._slots: Dict[str, int] = {}
+
+    def _store(self, seat: str, raw: bytes) -> bytes:
+        """Append ``raw`` and its digest as a new slot for ``seat``."""
+        digest = hashlib.sha256(raw).digest()
+        self._slots[seat] = len(self._slots)
+        self._buf += raw
+        self._buf += digest
+        return digest
 
     def create_seed(self, seat: str) -> str:
         """Generate a new seed for ``seat`` and return its commitment.
@@ -35,13 +53,37 @@ class SeedManager:
         ValueError
             If a seed for the given seat already exists.
         """
-        if seat in self._seeds:
+        if seat in self._slots:
             raise ValueError(f"seed already exists for seat {seat}")
 
-        raw = secrets.token_bytes(32)
-        commitment = hashlib.sha256(raw).hexdigest()
-        self._seeds[seat] = (raw, commitment)
-        return commitment
+        return self._store(seat, secrets.token_bytes(_SEED_SIZE)).hex()
+
+    def create_seeds(self, seats: List[str]) -> Dict[str, str]:
+        """Generate seeds for many seats at once and return their commitments.
+
+        All randomness is drawn with a single ``secrets.token_bytes`` call
+        and sliced per seat; hashing goes through ``hashlib`` (OpenSSL,
+        hardware SHA extensions where the CPU has them).  Returns a mapping
+        of seat to hex commitment, in input order.
+
+        Raises
+        ------
+        ValueError
+            If ``seats`` repeats a seat or any seat already has a seed.  No
+            seeds are created in that case.
+        """
+        if len(set(seats)) != len(seats):
+            raise ValueError("duplicate seat in batch")
+        for seat in seats:
+            if seat in self._slots:
+                raise ValueError(f"seed already exists for seat {seat}")
+
+        pool = secrets.token_bytes(_SEED_SIZE * len(seats))
+        commitments = {}
+        for i, seat in enumerate(seats):
+            raw = pool[i * _SEED_SIZE:(i + 1) * _SEED_SIZE]
+            commitments[seat] = self._store(seat, raw).hex()
+        return commitments
 
     def reveal_seed(self, seat: str) -> str:
         """Return the hex‑encoded seed previously generated for ``seat``.
@@ -51,23 +93,50 @@ class SeedManager:
         KeyError
             If no seed for the seat exists.
         """
-        if seat not in self._seeds:
+        if seat not in self._slots:
             raise KeyError(f"no seed stored for seat {seat}")
-        raw, _ = self._seeds[seat]
-        return raw.hex()
+        offset = self._slots[seat] * _ENTRY_SIZE
+        return self._buf[offset:offset + _SEED_SIZE].hex()
 
     def verify_commitment(self, seat: str, seed_hex: str) -> bool:
         """Check that ``seed_hex`` matches the previously published commitment.
 
-        Returns ``False`` if the seat is unknown or if the hash doesn't match.
+        Returns ``False`` if the seat is unknown, if ``seed_hex`` is not valid
+        hex, or if the hash doesn't match.  The raw 32‑byte digests are
+        compared in constant time.
         """
-        entry = self._seeds.get(seat)
-        if entry is None:
-            return False
-        _, commitment = entry
-        computed = hashlib.sha256(bytes.fromhex(seed_hex)).hexdigest()
-        return computed == commitment
+        return self._seed_matches(self._buf, seat, seed_hex)
+
+    def verify_many(self, reveals: Dict[str, str]) -> Dict[str, bool]:
+        """Check many revealed seeds at once, e.g. every seat at round end.
+
+        ``reveals`` maps seat to revealed ``seed_hex``.  Each result follows
+        the same rules as :meth:`verify_commitment`; digests are compared
+        in place against a single view of the packed buffer instead of
+        being copied out per seat.
+        """
+        with memoryview(self._buf) as buf:
+            return {
+                seat: self._seed_matches(buf, seat, seed_hex)
+                for seat, seed_hex in reveals.items()
+            }
 
+    def _seed_matches(self, buf, seat: str, seed_hex: str) -> bool:
+        """Shared check behind ``verify_commitment`` and ``verify_many``.
+
+        ``buf`` is the packed buffer itself or a view of it.
+        """
+        slot = self._slots.get(seat)
+        if slot is None:
+            return False
+        try:
+            raw = bytes.fromhex(seed_hex)
+        except ValueError:
+            return False
+        offset = slot * _ENTRY_SIZE + _SEED_SIZE
+        return hmac.compare_digest(
+            hashlib.sha256(raw).digest(), buf[offset:offset + _DIGEST_SIZE]
+        )
 
 
 # simple convenience functions for ad‑hoc use
@@ -45,6 +45,9 @@ def test_seed_lifecycle():
     # wrong seed should fail
     assert not mgr.verify_commitment(seat, "deadbeef")
 
+    # malformed hex is rejected rather than raising
+    assert not mgr.verify_commitment(seat, "not hex")
+
     # unknown seats behave predictably
     try:
         mgr.reveal_seed("unknown")
@@ -54,9 +57,59 @@ def test_seed_lifecycle():
     assert not mgr.verify_commitment("unknown", seed_hex)
 
 
+def test_create_seeds_batch():
+    mgr = SeedManager()
+    seats = ["A", "B", "C"]
+
+    commitments = mgr.create_seeds(seats)
+    assert list(commitments) == seats
+    assert all(len(c) == 64 for c in commitments.values())
+    assert len(set(commitments.values())) == len(seats)
+
+    # every batch-created seed reveals and verifies like a single one
+    for seat in seats:
+        assert mgr.verify_commitment(seat, mgr.reveal_seed(seat))
+
+    # duplicates (within the batch or already stored) are rejected up front
+    for bad in (["D", "D"], ["E", "A"]):
+        try:
+            mgr.create_seeds(bad)
+            raise AssertionError("expected ValueError for duplicate seat")
+        except ValueError:
+            pass
+    try:
+        mgr.reveal_seed("E")
+        raise AssertionError("failed batch must not store any seed")
+    except KeyError:
+        pass
+
+
+def test_verify_many():
+    mgr = SeedManager()
+    mgr.create_seeds(["A", "B", "C"])
+    reveals = {
+        "A": mgr.reveal_seed("A"),   # correct
+        "B": mgr.reveal_seed("C"),   # someone else's seed
+        "C": "not hex",              # malformed
+        "D": mgr.reveal_seed("A"),   # unknown seat
+    }
+
+    results = mgr.verify_many(reveals)
+    assert results == {"A": True, "B": False, "C": False, "D": False}
+
+    # batch results agree with one-at-a-time verification
+    for seat, seed_hex in reveals.items():
+        assert results[seat] == mgr.verify_commitment(seat, seed_hex)
+
+    # the manager still accepts new seats after a batch verification
+    mgr.create_seed("E")
+
+
 def main():
     """Run the tests without pytest."""
     test_seed_lifecycle()
+    test_create_seeds_batch()
+    test_verify_many()
     print("seed tests passed")
 
 